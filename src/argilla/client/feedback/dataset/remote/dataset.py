@@ -15,6 +15,7 @@
 import textwrap
 import warnings
 from datetime import datetime
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
 
 from tqdm import trange
@@ -408,11 +409,12 @@ class RemoteFeedbackDataset(FeedbackDatasetBase[RemoteFeedbackRecord]):
         """Returns the datetime when the dataset was last updated in Argilla."""
         return self._updated_at
 
-    @property
+    # The questions of a `RemoteFeedbackDataset` are fixed once created, so the mappings are only computed once
+    @cached_property
     def _question_id_to_name(self) -> Dict["UUID", str]:
         return {question.id: question.name for question in self._questions}
 
-    @property
+    @cached_property
     def _question_name_to_id(self) -> Dict[str, "UUID"]:
         return {question.name: question.id for question in self._questions}
 
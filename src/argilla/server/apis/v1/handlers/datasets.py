@@ -16,7 +16,7 @@ import re
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Security, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, Security, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import Annotated
 
@@ -267,6 +267,14 @@ async def _filter_metadata_properties_by_policy(
     return filtered_metadata_properties
 
 
+def _records_json_response(records: Union[Records, SearchRecordsResult]) -> Response:
+    # Records are built from database rows, so they are encoded here instead of letting FastAPI validate and encode
+    # them again through `response_model`, which is still used to document the endpoint
+    # Keep the same encoding options as FastAPI's JSONResponse: compact and UTF-8, rejecting NaN values
+    content = records.json(exclude_unset=True, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    return Response(content=content, media_type="application/json")
+
+
 @router.get("/me/datasets", response_model=Datasets)
 async def list_current_user_datasets(
     *,
@@ -284,7 +292,7 @@ async def list_current_user_datasets(
             dataset_list = current_user.datasets
     else:
         dataset_list = await datasets.list_datasets_by_workspace_id(db, workspace_id)
-    return Datasets(items=dataset_list)
+    return Datasets.construct(items=[Dataset.from_orm_fast(dataset) for dataset in dataset_list])
 
 
 @router.get("/datasets/{dataset_id}/fields", response_model=Fields)
@@ -295,7 +303,7 @@ async def list_dataset_fields(
 
     await authorize(current_user, DatasetPolicyV1.get(dataset))
 
-    return Fields(items=dataset.fields)
+    return Fields.construct(items=[Field.from_orm_fast(field) for field in dataset.fields])
 
 
 @router.get("/datasets/{dataset_id}/questions", response_model=Questions)
@@ -306,7 +314,7 @@ async def list_dataset_questions(
 
     await authorize(current_user, DatasetPolicyV1.get(dataset))
 
-    return Questions(items=dataset.questions)
+    return Questions.construct(items=[Question.from_orm_fast(question) for question in dataset.questions])
 
 
 @router.get("/me/datasets/{dataset_id}/metadata-properties", response_model=MetadataProperties)
@@ -321,7 +329,9 @@ async def list_current_user_dataset_metadata_properties(
         current_user, dataset.metadata_properties
     )
 
-    return MetadataProperties(items=filtered_metadata_properties)
+    return MetadataProperties.construct(
+        items=[MetadataProperty.from_orm_fast(metadata_property) for metadata_property in filtered_metadata_properties]
+    )
 
 
 SortByQueryParamParsed = Annotated[
@@ -382,7 +392,9 @@ async def list_current_user_dataset_records(
             limit=limit,
         )
 
-    return Records(items=records, total=total)
+    return _records_json_response(
+        Records.construct(items=[RecordSchema.from_orm_fast(record) for record in records], total=total)
+    )
 
 
 @router.get("/datasets/{dataset_id}/records", response_model=Records, response_model_exclude_unset=True)
@@ -420,7 +432,9 @@ async def list_dataset_records(
             db, dataset_id, include=include, response_statuses=response_statuses, offset=offset, limit=limit
         )
 
-    return Records(items=records, total=total)
+    return _records_json_response(
+        Records.construct(items=[RecordSchema.from_orm_fast(record) for record in records], total=total)
+    )
 
 
 @router.get("/datasets/{dataset_id}", response_model=Dataset)
@@ -705,11 +719,13 @@ async def search_dataset_records(
 
     for record in records:
         record_id_score_map[record.id]["search_record"] = SearchRecord(
-            record=RecordSchema.from_orm(record), query_score=record_id_score_map[record.id]["query_score"]
+            record=RecordSchema.from_orm_fast(record), query_score=record_id_score_map[record.id]["query_score"]
         )
 
-    return SearchRecordsResult(
-        items=[record["search_record"] for record in record_id_score_map.values()], total=search_responses.total
+    return _records_json_response(
+        SearchRecordsResult(
+            items=[record["search_record"] for record in record_id_score_map.values()], total=search_responses.total
+        )
     )
 
 
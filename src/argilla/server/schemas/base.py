@@ -12,10 +12,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Any, Dict, Set, Union
+from typing import AbstractSet, Any, Dict, Type, TypeVar, Union
 
 from pydantic import BaseModel, root_validator
 
+_MISSING = object()
+
+ORMSchemaT = TypeVar("ORMSchemaT", bound="ORMSchema")
+
 
 class UpdateSchema(BaseModel):
     """Base schema for update endpoints. `__non_nullable_fields__` is a set of fields that cannot be set to `None`
@@ -23,7 +27,7 @@ class UpdateSchema(BaseModel):
     `ValueError` if any of the fields in the set was set to `None` explicitly.
     """
 
-    __non_nullable_fields__: Union[Set[str], None] = None
+    __non_nullable_fields__: Union[AbstractSet[str], None] = None
 
     @root_validator(pre=True)
     def validate_non_nullable_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
@@ -39,3 +43,34 @@ class UpdateSchema(BaseModel):
             raise ValueError(f"The following keys must have non-null values: {', '.join(invalid_keys)}")
 
         return values
+
+
+class ORMSchema(BaseModel):
+    """Base schema for models read from database rows. `from_orm_fast` builds the schema using `construct`, skipping
+    the validation done by `from_orm`, and should only be used with objects coming from the database. Values are
+    read using the configured `getter_dict`, so fields not returned by it are left unset as `from_orm` does, and
+    nested `ORMSchema` fields are built recursively. Instances are not copied when used as values of other models.
+    """
+
+    class Config:
+        copy_on_model_validation = "none"
+
+    @classmethod
+    def from_orm_fast(cls: Type[ORMSchemaT], obj: Any) -> ORMSchemaT:
+        getter_dict = cls.__config__.getter_dict(obj)
+
+        values = {}
+        for name, field in cls.__fields__.items():
+            value = getter_dict.get(field.alias, _MISSING)
+            if value is _MISSING:
+                continue
+
+            if value is not None and isinstance(field.type_, type) and issubclass(field.type_, ORMSchema):
+                if isinstance(value, (list, tuple)):
+                    value = [field.type_.from_orm_fast(item) for item in value]
+                else:
+                    value = field.type_.from_orm_fast(value)
+
+            values[name] = value
+
+        return cls.construct(**values)
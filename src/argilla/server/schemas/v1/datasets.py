@@ -12,17 +12,18 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Literal, Optional, TypeVar, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Union
 from uuid import UUID
 
 from fastapi import Query
 from pydantic import BaseModel, conlist, constr, root_validator, validator
 from pydantic import Field as PydanticField
-from pydantic.generics import GenericModel
 from pydantic.utils import GetterDict
 
-from argilla.server.schemas.base import UpdateSchema
+from argilla.server.schemas.base import ORMSchema, UpdateSchema
 from argilla.server.schemas.v1.records import RecordUpdate
 from argilla.server.schemas.v1.suggestions import Suggestion, SuggestionCreate
 from argilla.server.search_engine import StringQuery
@@ -47,17 +48,17 @@ FIELD_CREATE_NAME_MAX_LENGTH = 200
 FIELD_CREATE_TITLE_MIN_LENGTH = 1
 FIELD_CREATE_TITLE_MAX_LENGTH = 500
 
-QUESTION_CREATE_NAME_REGEX = r"^(?=.*[a-z0-9])[a-z0-9_-]+$"
-QUESTION_CREATE_NAME_MIN_LENGTH = 1
-QUESTION_CREATE_NAME_MAX_LENGTH = 200
+QUESTION_CREATE_NAME_REGEX = FIELD_CREATE_NAME_REGEX
+QUESTION_CREATE_NAME_MIN_LENGTH = FIELD_CREATE_NAME_MIN_LENGTH
+QUESTION_CREATE_NAME_MAX_LENGTH = FIELD_CREATE_NAME_MAX_LENGTH
 QUESTION_CREATE_TITLE_MIN_LENGTH = 1
 QUESTION_CREATE_TITLE_MAX_LENGTH = 500
 QUESTION_CREATE_DESCRIPTION_MIN_LENGTH = 1
 QUESTION_CREATE_DESCRIPTION_MAX_LENGTH = 1000
 
-METADATA_PROPERTY_CREATE_NAME_REGEX = r"^(?=.*[a-z0-9])[a-z0-9_-]+$"
-METADATA_PROPERTY_CREATE_NAME_MIN_LENGTH = 1
-METADATA_PROPERTY_CREATE_NAME_MAX_LENGTH = 200
+METADATA_PROPERTY_CREATE_NAME_REGEX = FIELD_CREATE_NAME_REGEX
+METADATA_PROPERTY_CREATE_NAME_MIN_LENGTH = FIELD_CREATE_NAME_MIN_LENGTH
+METADATA_PROPERTY_CREATE_NAME_MAX_LENGTH = FIELD_CREATE_NAME_MAX_LENGTH
 METADATA_PROPERTY_CREATE_TITLE_MIN_LENGTH = 1
 METADATA_PROPERTY_CREATE_TITLE_MAX_LENGTH = 500
 
@@ -91,7 +92,7 @@ RECORDS_UPDATE_MIN_ITEMS = 1
 RECORDS_UPDATE_MAX_ITEMS = 1000
 
 
-class Dataset(BaseModel):
+class Dataset(ORMSchema):
     id: UUID
     name: str
     guidelines: Optional[str]
@@ -132,7 +133,7 @@ class DatasetUpdate(UpdateSchema):
     name: Optional[DatasetName]
     guidelines: Optional[DatasetGuidelines]
 
-    __non_nullable_fields__ = {"name"}
+    __non_nullable_fields__ = frozenset({"name"})
 
 
 class RecordMetrics(BaseModel):
@@ -156,7 +157,7 @@ class TextFieldSettings(BaseModel):
     use_markdown: bool = False
 
 
-class Field(BaseModel):
+class Field(ORMSchema):
     id: UUID
     name: str
     title: str
@@ -173,14 +174,14 @@ class Fields(BaseModel):
     items: List[Field]
 
 
-FieldName = Annotated[
-    constr(
-        regex=FIELD_CREATE_NAME_REGEX,
-        min_length=FIELD_CREATE_NAME_MIN_LENGTH,
-        max_length=FIELD_CREATE_NAME_MAX_LENGTH,
-    ),
-    PydanticField(..., description="The name of the field"),
-]
+# Fields, questions and metadata properties names have the same constraints, so they share a single constrained type
+_ResourceName = constr(
+    regex=FIELD_CREATE_NAME_REGEX,
+    min_length=FIELD_CREATE_NAME_MIN_LENGTH,
+    max_length=FIELD_CREATE_NAME_MAX_LENGTH,
+)
+
+FieldName = Annotated[_ResourceName, PydanticField(..., description="The name of the field")]
 
 FieldTitle = Annotated[
     constr(min_length=FIELD_CREATE_TITLE_MIN_LENGTH, max_length=FIELD_CREATE_TITLE_MAX_LENGTH),
@@ -205,14 +206,10 @@ class UniqueValuesCheckerMixin(BaseModel):
     def check_unique_values(cls, values: Dict[str, Any]) -> Dict[str, Any]:
         options = values.get("options", [])
         seen = set()
-        duplicates = set()
         for option in options:
             if option.value in seen:
-                duplicates.add(option.value)
-            else:
-                seen.add(option.value)
-        if duplicates:
-            raise ValueError(f"Option values must be unique, found duplicates: {duplicates}")
+                raise ValueError(f"Option values must be unique, found duplicate: {option.value!r}")
+            seen.add(option.value)
         return values
 
 
@@ -266,16 +263,18 @@ class LabelSelectionQuestionSettingsCreate(UniqueValuesCheckerMixin):
     )
     visible_options: Optional[int] = PydanticField(None, ge=LABEL_SELECTION_MIN_VISIBLE_OPTIONS)
 
-    @root_validator
+    @root_validator(skip_on_failure=True)
     def check_visible_options_value(cls, values: Dict[str, Any]) -> Dict[str, Any]:
         visible_options = values.get("visible_options")
-        if visible_options is not None:
-            num_options = len(values["options"])
-            if visible_options > num_options:
-                raise ValueError(
-                    "The value for 'visible_options' must be less or equal to the number of items in 'options'"
-                    f" ({num_options})"
-                )
+        if visible_options is None:
+            return values
+
+        num_options = len(values.get("options") or ())
+        if visible_options > num_options:
+            raise ValueError(
+                "The value for 'visible_options' must be less or equal to the number of items in 'options'"
+                f" ({num_options})"
+            )
         return values
 
 
@@ -304,7 +303,7 @@ QuestionSettingsCreate = Annotated[
 ]
 
 
-class Question(BaseModel):
+class Question(ORMSchema):
     id: UUID
     name: str
     title: str
@@ -322,14 +321,7 @@ class Questions(BaseModel):
     items: List[Question]
 
 
-QuestionName = Annotated[
-    constr(
-        regex=QUESTION_CREATE_NAME_REGEX,
-        min_length=QUESTION_CREATE_NAME_MIN_LENGTH,
-        max_length=QUESTION_CREATE_NAME_MAX_LENGTH,
-    ),
-    PydanticField(..., description="The name of the question"),
-]
+QuestionName = Annotated[_ResourceName, PydanticField(..., description="The name of the question")]
 
 QuestionTitle = Annotated[
     constr(
@@ -364,7 +356,7 @@ class ResponseValueCreate(BaseModel):
     value: Any
 
 
-class Response(BaseModel):
+class Response(ORMSchema):
     id: UUID
     values: Optional[Dict[str, ResponseValue]]
     status: ResponseStatus
@@ -376,18 +368,22 @@ class Response(BaseModel):
         orm_mode = True
 
 
+_RECORD_GETTER_DICT_PASSTHROUGH_KEYS = frozenset({"id", "fields", "external_id", "inserted_at", "updated_at"})
+_RECORD_GETTER_DICT_RELATIONSHIP_KEYS = frozenset({"responses", "suggestions"})
+
+
 class RecordGetterDict(GetterDict):
     def get(self, key: str, default: Any) -> Any:
+        if key in _RECORD_GETTER_DICT_PASSTHROUGH_KEYS:
+            return getattr(self._obj, key, default)
         if key == "metadata":
             return getattr(self._obj, "metadata_", None)
-        if key == "responses" and not self._obj.is_relationship_loaded("responses"):
-            return default
-        if key == "suggestions" and not self._obj.is_relationship_loaded("suggestions"):
+        if key in _RECORD_GETTER_DICT_RELATIONSHIP_KEYS and not self._obj.is_relationship_loaded(key):
             return default
         return super().get(key, default)
 
 
-class Record(BaseModel):
+class Record(ORMSchema):
     id: UUID
     fields: Dict[str, Any]
     metadata: Optional[Dict[str, Any]]
@@ -440,11 +436,11 @@ class RecordCreate(BaseModel):
         if values is None:
             return values
 
-        user_ids = []
+        user_ids = set()
         for value in values:
             if value.user_id in user_ids:
                 raise ValueError(f"Responses contains several responses for the same user_id: {str(value.user_id)!r}")
-            user_ids.append(value.user_id)
+            user_ids.add(value.user_id)
 
         return values
 
@@ -465,14 +461,8 @@ class RecordsUpdate(BaseModel):
     )
 
 
-NT = TypeVar("NT", int, float)
-
-
-class NumericMetadataProperty(GenericModel, Generic[NT]):
-    min: Optional[NT] = None
-    max: Optional[NT] = None
-
-    @root_validator
+class NumericMetadataProperty(BaseModel):
+    @root_validator(skip_on_failure=True)
     def check_bounds(cls, values: Dict[str, Any]) -> Dict[str, Any]:
         min = values.get("min")
         max = values.get("max")
@@ -490,12 +480,16 @@ class TermsMetadataPropertyCreate(BaseModel):
     )
 
 
-class IntegerMetadataPropertyCreate(NumericMetadataProperty[int]):
+class IntegerMetadataPropertyCreate(NumericMetadataProperty):
     type: Literal[MetadataPropertyType.integer]
+    min: Optional[int] = None
+    max: Optional[int] = None
 
 
-class FloatMetadataPropertyCreate(NumericMetadataProperty[float]):
+class FloatMetadataPropertyCreate(NumericMetadataProperty):
     type: Literal[MetadataPropertyType.float]
+    min: Optional[float] = None
+    max: Optional[float] = None
 
 
 MetadataPropertyTitle = Annotated[
@@ -510,12 +504,7 @@ MetadataPropertySettingsCreate = Annotated[
 
 
 class MetadataPropertyCreate(BaseModel):
-    name: str = PydanticField(
-        ...,
-        regex=METADATA_PROPERTY_CREATE_NAME_REGEX,
-        min_length=METADATA_PROPERTY_CREATE_NAME_MIN_LENGTH,
-        max_length=METADATA_PROPERTY_CREATE_NAME_MAX_LENGTH,
-    )
+    name: _ResourceName
     title: MetadataPropertyTitle
     settings: MetadataPropertySettingsCreate
     visible_for_annotators: bool = True
@@ -544,7 +533,7 @@ MetadataPropertySettings = Annotated[
 ]
 
 
-class MetadataProperty(BaseModel):
+class MetadataProperty(ORMSchema):
     id: UUID
     name: str
     title: str
@@ -561,12 +550,17 @@ class MetadataProperties(BaseModel):
     items: List[MetadataProperty]
 
 
+@dataclass(frozen=True)
 class MetadataParsedQueryParam:
-    def __init__(self, string: str):
-        k, *v = string.split(":", maxsplit=1)
+    name: str
+    value: str
+
+
+@lru_cache(maxsize=1024)
+def _parse_metadata_query_param(string: str) -> MetadataParsedQueryParam:
+    k, *v = string.split(":", maxsplit=1)
 
-        self.name: str = k
-        self.value: str = "".join(v).strip()
+    return MetadataParsedQueryParam(name=k, value="".join(v).strip())
 
 
 class MetadataQueryParams(BaseModel):
@@ -575,7 +569,7 @@ class MetadataQueryParams(BaseModel):
     @property
     def metadata_parsed(self) -> List[MetadataParsedQueryParam]:
         # TODO: Validate metadata fields names from query params
-        return [MetadataParsedQueryParam(q) for q in self.metadata]
+        return [_parse_metadata_query_param(q) for q in self.metadata]
 
 
 class TextQuery(BaseModel):
@@ -51,4 +51,4 @@ class FieldUpdate(UpdateSchema):
     title: Optional[FieldTitle]
     settings: Optional[TextFieldSettingsUpdate]
 
-    __non_nullable_fields__ = {"title", "settings"}
+    __non_nullable_fields__ = frozenset({"title", "settings"})
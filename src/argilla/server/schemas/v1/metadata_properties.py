@@ -86,4 +86,4 @@ class MetadataPropertyUpdate(UpdateSchema):
     title: Optional[MetadataPropertyTitle]
     visible_for_annotators: Optional[bool]
 
-    __non_nullable_fields__ = {"title", "visible_for_annotators"}
+    __non_nullable_fields__ = frozenset({"title", "visible_for_annotators"})
@@ -95,7 +95,7 @@ class TextQuestionSettingsUpdate(UpdateSchema):
     type: Literal[QuestionType.text]
     use_markdown: Optional[bool]
 
-    __non_nullable_fields__ = {"use_markdown"}
+    __non_nullable_fields__ = frozenset({"use_markdown"})
 
 
 class RatingQuestionSettingsUpdate(UpdateSchema):
@@ -132,4 +132,4 @@ class QuestionUpdate(UpdateSchema):
     description: Optional[QuestionDescription]
     settings: Optional[QuestionSettingsUpdate]
 
-    __non_nullable_fields__ = {"title", "settings"}
+    __non_nullable_fields__ = frozenset({"title", "settings"})
@@ -18,6 +18,7 @@ from uuid import UUID
 from pydantic import BaseModel
 
 from argilla.server.models import SuggestionType
+from argilla.server.schemas.base import ORMSchema
 
 
 class BaseSuggestion(BaseModel):
@@ -32,7 +33,7 @@ class SuggestionCreate(BaseSuggestion):
     pass
 
 
-class Suggestion(BaseSuggestion):
+class Suggestion(BaseSuggestion, ORMSchema):
     id: UUID
 
     class Config:
@@ -30,6 +30,8 @@ from argilla.client.sdk.v1.datasets.models import FeedbackItemModel, FeedbackSug
 from argilla.client.sdk.v1.workspaces.models import WorkspaceModel
 from pytest_mock import MockerFixture
 
+NOW = datetime(2023, 1, 1)
+
 
 @pytest.fixture()
 def test_remote_dataset(mock_httpx_client: httpx.Client) -> RemoteFeedbackDataset:
@@ -42,14 +44,14 @@ def test_remote_dataset(mock_httpx_client: httpx.Client) -> RemoteFeedbackDatase
             ws=WorkspaceModel(
                 id=uuid4(),
                 name="test-remote-workspace",
-                inserted_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+                inserted_at=NOW,
+                updated_at=NOW,
             ),
         ),
         fields=[RemoteTextField(id=uuid4(), name="text")],
         questions=[RemoteTextQuestion(id=uuid4(), name="text")],
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        created_at=NOW,
+        updated_at=NOW,
     )
 
 
@@ -74,26 +76,35 @@ def configure_mock_routes(mock_httpx_client: httpx.Client, mock_routes: Dict) ->
         getattr(mock_httpx_client, method).side_effect = _mock_route(routes)
 
 
-def create_mock_routes(
-    test_remote_dataset: RemoteFeedbackDataset, test_remote_record: RemoteFeedbackRecord
+@pytest.fixture(scope="module")
+def mock_me_response() -> httpx.Response:
+    return httpx.Response(
+        status_code=200,
+        content=UserModel(
+            id=uuid4(),
+            first_name="test",
+            username="test",
+            role=UserRole.owner,
+            api_key="api.key",
+            inserted_at=NOW,
+            updated_at=NOW,
+        ).json(),
+    )
+
+
+@pytest.fixture()
+def mock_routes(
+    mock_httpx_client: httpx.Client,
+    mock_me_response: httpx.Response,
+    test_remote_dataset: RemoteFeedbackDataset,
+    test_remote_record: RemoteFeedbackRecord,
 ) -> Dict[str, Dict[str, httpx.Response]]:
     routes = {
         "put": {},
         "post": {},
         "delete": {},
         "get": {
-            "/api/me": httpx.Response(
-                status_code=200,
-                content=UserModel(
-                    id=uuid4(),
-                    first_name="test",
-                    username="test",
-                    role=UserRole.owner,
-                    api_key="api.key",
-                    inserted_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                ).json(),
-            ),
+            "/api/me": mock_me_response,
             f"/api/v1/me/datasets/{test_remote_dataset.id}/metadata-properties": httpx.Response(
                 status_code=200, json={"items": []}
             ),
@@ -104,8 +115,8 @@ def create_mock_routes(
                 content=FeedbackItemModel(
                     id=test_remote_record.id,
                     fields=test_remote_record.fields,
-                    inserted_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
+                    inserted_at=NOW,
+                    updated_at=NOW,
                 ).json(),
             ),
             f"/api/v1/datasets/{test_remote_dataset.id}/records": httpx.Response(
@@ -113,10 +124,12 @@ def create_mock_routes(
             ),
         },
     }
+    configure_mock_routes(mock_httpx_client, routes)
     return routes
 
 
 class TestSuiteRemoteDataset:
+    @pytest.mark.usefixtures("mock_routes")
     def test_update_records(
         self,
         mock_httpx_client: httpx.Client,
@@ -125,9 +138,6 @@ class TestSuiteRemoteDataset:
     ) -> None:
         """Test updating records."""
 
-        mock_routes = create_mock_routes(test_remote_dataset, test_remote_record)
-        configure_mock_routes(mock_httpx_client, mock_routes)
-
         test_remote_dataset.update_records(records=[test_remote_record])
 
         mock_httpx_client.patch.assert_called_once_with(
@@ -135,6 +145,7 @@ class TestSuiteRemoteDataset:
             json={"items": [{"id": str(test_remote_record.id), "metadata": {"new": "metadata"}, "suggestions": []}]},
         )
 
+    @pytest.mark.usefixtures("mock_routes")
     def test_update_multiple_records(
         self,
         mock_httpx_client: httpx.Client,
@@ -143,15 +154,13 @@ class TestSuiteRemoteDataset:
     ) -> None:
         """Test updating records."""
 
-        mock_routes = create_mock_routes(test_remote_dataset, test_remote_record)
-        configure_mock_routes(mock_httpx_client, mock_routes)
-
         mock_httpx_client.patch.return_value = httpx.Response(status_code=204)
 
         test_remote_dataset.update_records(records=[test_remote_record] * 10)
 
         assert mock_httpx_client.patch.call_count == 1
 
+    @pytest.mark.usefixtures("mock_routes")
     def test_update_records_with_multiple_suggestions(
         self,
         mock_httpx_client: httpx.Client,
@@ -159,9 +168,6 @@ class TestSuiteRemoteDataset:
         test_remote_record: RemoteFeedbackRecord,
     ) -> None:
         """Test updating records."""
-        mock_routes = create_mock_routes(test_remote_dataset, test_remote_record)
-        configure_mock_routes(mock_httpx_client, mock_routes)
-
         test_remote_record.suggestions = [
             SuggestionSchema(question_name="text", value="Test value", score=0.5, agent="test")
         ] * 10
@@ -169,7 +175,9 @@ class TestSuiteRemoteDataset:
         test_remote_dataset.update_records(records=[test_remote_record] * 10)
 
         assert mock_httpx_client.patch.call_count == 1
+        mock_httpx_client.put.assert_not_called()
 
+    @pytest.mark.usefixtures("mock_routes")
     def test_update_records_suggestions(
         self,
         mock_httpx_client: httpx.Client,
@@ -184,9 +192,6 @@ class TestSuiteRemoteDataset:
             agent="test",
         )
 
-        mock_routes = create_mock_routes(test_remote_dataset, test_remote_record)
-        configure_mock_routes(mock_httpx_client, mock_routes)
-
         test_remote_record.suggestions = [
             SuggestionSchema(question_name="text", value="Test value", score=0.5, agent="test")
         ]
@@ -223,6 +228,14 @@ class TestSuiteRemoteDataset:
         # TODO: Implement
         pass
 
+    def test_question_mappings_are_computed_once(self, test_remote_dataset: RemoteFeedbackDataset) -> None:
+        question = test_remote_dataset.question_by_name("text")
+
+        assert test_remote_dataset._question_name_to_id == {"text": question.id}
+        assert test_remote_dataset._question_name_to_id is test_remote_dataset._question_name_to_id
+        assert test_remote_dataset._question_id_to_name == {question.id: "text"}
+        assert test_remote_dataset._question_id_to_name is test_remote_dataset._question_id_to_name
+
     def test_push_to_huggingface_warnings(
         self, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch, test_remote_dataset: RemoteFeedbackDataset
     ) -> None:
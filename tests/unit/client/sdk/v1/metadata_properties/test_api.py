@@ -42,7 +42,7 @@ class TestSuiteMetadataPropertiesSDK:
         assert response.status_code == 200
         assert response.parsed.title == "new-title"
         assert response.parsed.visible_for_annotators is False
-        assert mock_httpx_client.patch.called_once_with(
-            url=f"/api/v1/metadata-properties/{metadata_property_id}",
-            json={"title": "new-title", "visible_for_annotators": False},
-        )
+        mock_httpx_client.patch.assert_called_once()
+        kwargs = mock_httpx_client.patch.call_args.kwargs
+        assert kwargs["url"] == f"/api/v1/metadata-properties/{metadata_property_id}"
+        assert kwargs["json"] == {"title": "new-title", "visible_for_annotators": False}
@@ -68,6 +68,7 @@ from argilla.server.search_engine import (
     TermsMetadataFilter,
     UserResponseStatusFilter,
 )
+from fastapi.responses import JSONResponse
 from sqlalchemy import func, inspect, select
 
 from tests.factories import (
@@ -624,6 +625,16 @@ class TestSuiteDatasets:
             ],
         }
 
+    async def test_list_dataset_records_encoding(self, async_client: "AsyncClient", owner_auth_header: dict):
+        dataset = await DatasetFactory.create()
+        await RecordFactory.create(fields={"text": "héllo 世界"}, dataset=dataset)
+
+        response = await async_client.get(f"/api/v1/datasets/{dataset.id}/records", headers=owner_auth_header)
+
+        assert response.status_code == 200
+        assert response.content == JSONResponse(content=response.json()).body
+        assert '"text":"héllo 世界"'.encode() in response.content
+
     @pytest.mark.parametrize(
         "includes",
         [[RecordInclude.responses], [RecordInclude.suggestions], [RecordInclude.responses, RecordInclude.suggestions]],
@@ -2695,6 +2706,13 @@ class TestSuiteDatasets:
                 ],
                 "visible_options": 5,
             },
+            {
+                "type": "label_selection",
+                "options": [
+                    {"value": "a", "text": "a", "description": "a"},
+                ],
+                "visible_options": 3,
+            },
             {
                 "type": "ranking",
                 "options": [
@@ -12,10 +12,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Optional
+from types import SimpleNamespace
+from typing import Any, List, Optional
 
 import pytest
-from argilla.server.schemas.base import UpdateSchema
+from argilla.server.schemas.base import ORMSchema, UpdateSchema
+from pydantic.utils import GetterDict
 
 
 def test_update_schema():
@@ -27,3 +29,34 @@ def test_update_schema():
 
     with pytest.raises(ValueError):
         UnitTestUpdateSchema(unit=None, test=None)
+
+
+def test_orm_schema_from_orm_fast():
+    class UnitTestChildSchema(ORMSchema):
+        name: str
+
+        class Config:
+            orm_mode = True
+
+    class UnitTestGetterDict(GetterDict):
+        def get(self, key: str, default: Any) -> Any:
+            if key == "hidden":
+                return default
+            return super().get(key, default)
+
+    class UnitTestSchema(ORMSchema):
+        id: int
+        hidden: Optional[str]
+        children: Optional[List[UnitTestChildSchema]]
+
+        class Config:
+            orm_mode = True
+            getter_dict = UnitTestGetterDict
+
+    obj = SimpleNamespace(id=1, hidden="hidden", children=[SimpleNamespace(name="child")])
+
+    schema = UnitTestSchema.from_orm_fast(obj)
+
+    assert schema == UnitTestSchema.from_orm(obj)
+    assert schema.__fields_set__ == {"id", "children"}
+    assert schema.children == [UnitTestChildSchema(name="child")]